@@ -0,0 +1,46 @@
+"""
+Console-script metadata for the afdko build.
+
+The entry-point table maps the legacy standalone command names to their
+deprecation wrappers in afdko._deprecated; the unified 'afdko' command
+is added on top. The table is built once at import time and frozen —
+build backends may call dynamic_metadata() several times per build, so
+each call is just a shallow copy plus one environment check.
+"""
+
+import os
+import types
+
+_BASE_SCRIPTS = types.MappingProxyType({
+    'buildcff2vf': 'afdko._deprecated:buildcff2vf_wrapper',
+    'buildmasterotfs': 'afdko._deprecated:buildmasterotfs_wrapper',
+    'comparefamily': 'afdko._deprecated:comparefamily_wrapper',
+    'checkoutlinesufo': 'afdko._deprecated:checkoutlinesufo_wrapper',
+    'makeotf': 'afdko._deprecated:makeotf_wrapper',
+    'makeinstancesufo': 'afdko._deprecated:makeinstancesufo_wrapper',
+    'otc2otf': 'afdko._deprecated:otc2otf_wrapper',
+    'otf2otc': 'afdko._deprecated:otf2otc_wrapper',
+    'otf2ttf': 'afdko._deprecated:otf2ttf_wrapper',
+    'ttfcomponentizer': 'afdko._deprecated:ttfcomponentizer_wrapper',
+    'ttfdecomponentizer': 'afdko._deprecated:ttfdecomponentizer_wrapper',
+    'ttxn': 'afdko._deprecated:ttxn_wrapper',
+    'charplot': 'afdko._deprecated:charplot_wrapper',
+    'digiplot': 'afdko._deprecated:digiplot_wrapper',
+    'fontplot': 'afdko._deprecated:fontplot_wrapper',
+    'fontplot2': 'afdko._deprecated:fontplot2_wrapper',
+    'fontsetplot': 'afdko._deprecated:fontsetplot_wrapper',
+    'hintplot': 'afdko._deprecated:hintplot_wrapper',
+    'waterfallplot': 'afdko._deprecated:waterfallplot_wrapper',
+    'otfautohint': 'afdko._deprecated:otfautohint_wrapper',
+    'otfstemhist': 'afdko._deprecated:otfstemhist_wrapper',
+})
+
+
+def dynamic_metadata():
+    """
+    Return the console_scripts mapping {command name: entry point}.
+    """
+    scripts = dict(_BASE_SCRIPTS)
+    if os.environ.get('AFDKO_COMMAND_USE_WRAPPER', 'ON') == 'ON':
+        scripts['afdko'] = 'afdko.invoker:main'
+    return scripts
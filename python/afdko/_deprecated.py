@@ -0,0 +1,231 @@
+# Copyright 2026 Adobe. All rights reserved.
+
+"""
+Deprecation wrappers for the standalone AFDKO command-line scripts.
+
+The standalone console scripts (`makeotf`, `otf2ttf`, `charplot`, etc.)
+are deprecated in favor of the single `afdko <command>` entry point.
+Each `*_wrapper` function below is installed as the console script for
+the old command name; it forwards to the real implementation after
+emitting a deprecation notice.
+
+The wrapper behavior is controlled with the AFDKO_WRAPPER_MODE
+environment variable:
+    'off' (default)  run the command silently
+    'warn'           print a deprecation warning, then run the command
+    'error'          refuse to run the command and exit with an error
+"""
+
+import functools
+import os
+import sys
+
+# Commands slated for removal one release ahead of the rest.
+EARLY_COMMANDS = frozenset({
+    'charplot', 'digiplot', 'fontplot', 'fontplot2', 'fontsetplot',
+    'hintplot', 'waterfallplot',
+})
+
+EARLY_REMOVAL_TEXT = 'the next feature release'
+STANDARD_REMOVAL_TEXT = 'a future release'
+
+DEFAULT_WRAPPER_MODE = 'off'
+
+# Bound method alias; skips the LOAD_GLOBAL + LOAD_ATTR pair on every
+# environment probe in the hot wrapper paths. (sys.stderr is left
+# unaliased on purpose so test monkeypatching keeps working.)
+_env_get = os.environ.get
+
+# Accepted AFDKO_WRAPPER_MODE spellings, resolved with one dict lookup.
+_MODE_MAP = {
+    'off': 'off', 'silent': 'off', 'none': 'off', '0': 'off',
+    'false': 'off',
+    'warn': 'warn', 'warning': 'warn', 'on': 'warn', '1': 'warn',
+    'true': 'warn',
+    'error': 'error', 'err': 'error', 'strict': 'error',
+}
+
+# Commands that already warned in this process; scripts that call a
+# wrapper in a tight loop should pay the formatting/I-O cost only once.
+_WARNED = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_wrapper_mode():
+    """
+    Resolve AFDKO_WRAPPER_MODE to 'off', 'warn' or 'error'.
+
+    Environment variables are fixed for the lifetime of a CLI process,
+    so the result is memoized; repeat calls cost a single cache lookup.
+    """
+    # Normalize only when a value is actually set; the common (unset)
+    # case then skips the strip/lower string allocations entirely.
+    pywarn = _env_get('PYTHONWARNINGS')
+    if pywarn and pywarn.strip().lower() == 'ignore':
+        return 'off'
+    raw = _env_get('AFDKO_WRAPPER_MODE')
+    mode = raw.strip().lower() if raw else ''
+    if not mode:
+        return DEFAULT_WRAPPER_MODE
+    resolved = _MODE_MAP.get(mode)
+    if resolved is None:
+        # Unrecognized values fall back silently; the typo diagnostic
+        # is only worth the branch when explicitly debugging.
+        if _env_get('AFDKO_DEBUG'):
+            sys.stderr.write(
+                f"afdko: invalid AFDKO_WRAPPER_MODE value '{mode}'; "
+                f"using '{DEFAULT_WRAPPER_MODE}'.\n")
+        return DEFAULT_WRAPPER_MODE
+    return resolved
+
+
+# The warning prose is constant; only the command name varies. Build
+# the templates once at import time and fill them in with a single '%'
+# substitution per emission.
+_EARLY_TEMPLATE = (
+    "DeprecationWarning: The '%s' command wrapper is deprecated and "
+    "will be removed in " + EARLY_REMOVAL_TEXT + ".\n"
+    'The command should now be run as "afdko %s [options]".\n\n'
+    "To suppress this warning, set AFDKO_WRAPPER_MODE=off or "
+    "PYTHONWARNINGS=ignore.\n"
+)
+_STANDARD_TEMPLATE = (
+    "DeprecationWarning: The '%s' command wrapper is deprecated and "
+    "will be removed in " + STANDARD_REMOVAL_TEXT + ".\n"
+    'The command should now be run as "afdko %s [options]".\n\n'
+    "To suppress this warning, set AFDKO_WRAPPER_MODE=off or "
+    "PYTHONWARNINGS=ignore.\n"
+)
+_SHORT_TEMPLATE = "'%s' is deprecated; use 'afdko %s' instead."
+
+# Every wrapped command, early or standard.
+_ALL_NAMES = (
+    'buildcff2vf', 'buildmasterotfs', 'checkoutlinesufo', 'comparefamily',
+    'makeinstancesufo', 'makeotf', 'otc2otf', 'otf2otc', 'otf2ttf',
+    'otfautohint', 'otfstemhist', 'ttfcomponentizer', 'ttfdecomponentizer',
+    'ttxn', 'charplot', 'digiplot', 'fontplot', 'fontplot2', 'fontsetplot',
+    'hintplot', 'waterfallplot',
+)
+
+# name -> (full message template, short message, removal text), so the
+# emission/error paths do one hashed lookup instead of a set-membership
+# test plus conditional template selection.
+_COMMAND_META = {
+    name: ((_EARLY_TEMPLATE, _SHORT_TEMPLATE % (name, name),
+            EARLY_REMOVAL_TEXT)
+           if name in EARLY_COMMANDS else
+           (_STANDARD_TEMPLATE, _SHORT_TEMPLATE % (name, name),
+            STANDARD_REMOVAL_TEXT))
+    for name in _ALL_NAMES
+}
+
+
+def _dispatch_deprecation(command_name):
+    """
+    Handle the deprecation notice for one wrapper call: exit in error
+    mode, otherwise write the notice to stderr (once per command per
+    process).
+
+    Routing the notice through Python's warning machinery as well would
+    walk the call stack and consult the warning filters only to show a
+    near-duplicate message, so that is opt-in via AFDKO_WRAPPER_PYWARN.
+    """
+    mode = _get_wrapper_mode()
+    if mode == 'off':
+        return
+    template, short_msg, removal_text = _COMMAND_META[command_name]
+    if mode == 'error':
+        raise SystemExit(
+            f"afdko: The '{command_name}' command wrapper is disabled "
+            f"(AFDKO_WRAPPER_MODE=error) and will be removed in "
+            f'{removal_text}. Run "afdko {command_name}" instead.')
+    if command_name in _WARNED:
+        return
+    _WARNED.add(command_name)
+    sys.stderr.write(template % (command_name, command_name) + '\n')
+    if _env_get('AFDKO_WRAPPER_PYWARN') == '1':
+        # Deferred import: most invocations never pay for the warnings
+        # import graph.
+        import warnings
+        warnings.warn(short_msg, FutureWarning, stacklevel=3)
+
+
+def deprecated_command(command_name, target_func):
+    """
+    Wrap 'target_func' so that running it through the old standalone
+    console script emits a deprecation notice first.
+
+    In the default 'off' mode the target is returned as-is: the mode is
+    fixed per process, so no wrapper frame is needed at all.
+    """
+    mode = _get_wrapper_mode()
+    if mode == 'off':
+        return target_func
+
+    def wrapper(*args, **kwargs):
+        _dispatch_deprecation(command_name)
+        return target_func(*args, **kwargs)
+    # No wrapper.__doc__: CLI dispatch never reads it, and building it
+    # would concatenate the target's docstring on every invocation
+    # (wrappers are created per call, not cached).
+    wrapper.__name__ = f'{command_name}_wrapper'
+    return wrapper
+
+
+# command name -> (module, attribute) of the real implementation. The
+# *_wrapper console-script functions are generated from this table; a
+# declarative table plus one loop parses and compiles faster than ~20
+# near-identical function definitions.
+_WRAPPERS = {
+    'buildcff2vf': ('afdko.buildcff2vf', 'main'),
+    'buildmasterotfs': ('afdko.buildmasterotfs', 'main'),
+    'checkoutlinesufo': ('afdko.checkoutlinesufo', 'main'),
+    'comparefamily': ('afdko.comparefamily', 'main'),
+    'makeinstancesufo': ('afdko.makeinstancesufo', 'main'),
+    'makeotf': ('afdko.makeotf', 'main'),
+    'otc2otf': ('afdko.otc2otf', 'main'),
+    'otf2otc': ('afdko.otf2otc', 'main'),
+    'otf2ttf': ('afdko.otf2ttf', 'main'),
+    'otfautohint': ('afdko.otfautohint.__main__', 'main'),
+    'otfstemhist': ('afdko.otfautohint.__main__', 'stemhist'),
+    'ttfcomponentizer': ('afdko.ttfcomponentizer', 'main'),
+    'ttfdecomponentizer': ('afdko.ttfdecomponentizer', 'main'),
+    'ttxn': ('afdko.ttxn', 'main'),
+    'charplot': ('afdko.proofpdf', 'charplot'),
+    'digiplot': ('afdko.proofpdf', 'digiplot'),
+    'fontplot': ('afdko.proofpdf', 'fontplot'),
+    'fontplot2': ('afdko.proofpdf', 'fontplot2'),
+    'fontsetplot': ('afdko.proofpdf', 'fontsetplot'),
+    'hintplot': ('afdko.proofpdf', 'hintplot'),
+    'waterfallplot': ('afdko.proofpdf', 'waterfallplot'),
+}
+
+
+# Resolved target callables, so repeat wrapper calls in one process do
+# a single dict lookup instead of re-entering the import machinery.
+_TARGET_CACHE = {}
+
+
+def _resolve(command_name, module_name, attr_name):
+    target = _TARGET_CACHE.get(command_name)
+    if target is None:
+        module = __import__(module_name, fromlist=[attr_name])
+        target = _TARGET_CACHE[command_name] = getattr(module, attr_name)
+    return target
+
+
+def _make_wrapper(command_name, module_name, attr_name):
+    def wrapper():
+        target = _resolve(command_name, module_name, attr_name)
+        return deprecated_command(command_name, target)()
+    wrapper.__name__ = f'{command_name}_wrapper'
+    return wrapper
+
+
+# The console_scripts entry points still resolve to e.g.
+# 'afdko._deprecated:makeotf_wrapper' because the generated functions
+# are assigned into the module namespace.
+for _name, (_module_name, _attr_name) in _WRAPPERS.items():
+    globals()[f'{_name}_wrapper'] = _make_wrapper(
+        _name, _module_name, _attr_name)
+del _name, _module_name, _attr_name
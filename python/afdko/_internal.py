@@ -0,0 +1,57 @@
+# Copyright 2026 Adobe. All rights reserved.
+
+"""
+Launchers for the native AFDKO tools (C executables).
+
+The executables are installed alongside the Python console scripts, so
+a plain PATH lookup finds them. Each launcher forwards the remaining
+command-line arguments unchanged and returns the tool's exit code.
+"""
+
+import subprocess
+import sys
+
+
+def _run_tool(name):
+    try:
+        return subprocess.call([name] + sys.argv[1:])
+    except FileNotFoundError:
+        print(f"afdko: the '{name}' executable could not be found.",
+              file=sys.stderr)
+        return 1
+
+
+def detype1():
+    return _run_tool('detype1')
+
+
+def makeotfexe():
+    return _run_tool('makeotfexe')
+
+
+def mergefonts():
+    return _run_tool('mergefonts')
+
+
+def rotatefont():
+    return _run_tool('rotatefont')
+
+
+def sfntdiff():
+    return _run_tool('sfntdiff')
+
+
+def sfntedit():
+    return _run_tool('sfntedit')
+
+
+def spot():
+    return _run_tool('spot')
+
+
+def tx():
+    return _run_tool('tx')
+
+
+def type1():
+    return _run_tool('type1')
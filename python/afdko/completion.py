@@ -0,0 +1,214 @@
+# Copyright 2026 Adobe. All rights reserved.
+
+"""
+Generate shell completion scripts for the 'afdko' command.
+
+'afdko completion <shell>' prints a completion script for bash, zsh,
+fish or powershell on stdout, ready to be sourced from the shell's
+startup file.
+"""
+
+import functools
+import os
+import sys
+from importlib.resources import files as resource_files
+
+SUPPORTED_SHELLS = ('bash', 'zsh', 'fish', 'powershell')
+
+USAGE = (
+    'Usage: afdko completion <shell>\n'
+    '\n'
+    'Print a completion script for <shell> on stdout.\n'
+    f"Supported shells: {', '.join(SUPPORTED_SHELLS)}\n"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def get_commands():
+    """
+    Return a sorted list of (name, description) tuples, one per
+    canonical command; abbreviations are excluded.
+
+    The command set is fixed for the life of the process, so the result
+    is memoized: only the first completion request pays for importing
+    the invoker's command registry.
+    """
+    try:
+        from afdko.invoker import ALL_COMMANDS
+    except ImportError:
+        return []
+    # One dict pass dedups by target (dicts preserve insertion order),
+    # and the in-place sort avoids the extra list sorted() allocates.
+    commands = list({
+        target: (name, desc)
+        for name, (target, desc, _category) in ALL_COMMANDS.items()
+        if desc is not None
+    }.values())
+    commands.sort()
+    return commands
+
+
+@functools.lru_cache(maxsize=1)
+def list_command_names():
+    """
+    Return a sorted list of canonical command names only. Cheaper than
+    get_commands() for shells (bash) that have no use for descriptions.
+    """
+    try:
+        from afdko.invoker import ALL_COMMANDS
+    except ImportError:
+        return []
+    names = [name for name, (_target, desc, _category)
+             in ALL_COMMANDS.items() if desc is not None]
+    names.sort()
+    return names
+
+
+def generate_bash(command_names):
+    words = ' '.join(command_names)
+    return f'''# bash completion for afdko
+_afdko_completion() {{
+    local cur
+    cur="${{COMP_WORDS[COMP_CWORD]}}"
+    if [[ $COMP_CWORD -eq 1 ]]; then
+        COMPREPLY=( $(compgen -W "{words}" -- "$cur") )
+    fi
+}}
+complete -F _afdko_completion afdko
+'''
+
+
+# Static preamble/postamble of the generated scripts; only the
+# per-command lines vary, and those are built with a tight append loop
+# plus '%' formatting rather than nested f-strings.
+_ZSH_PREAMBLE = '''#compdef afdko
+# zsh completion for afdko
+_afdko() {
+    local -a commands
+    commands=(
+        '''
+_ZSH_POSTAMBLE = '''
+    )
+    if (( CURRENT == 2 )); then
+        _describe 'command' commands
+    fi
+}
+_afdko "$@"
+'''
+_ZSH_LINE = "'%s:%s'"
+
+_FISH_PREAMBLE = '# fish completion for afdko\n'
+_FISH_LINE = ('complete -c afdko -f -n "__fish_use_subcommand" '
+              '-a %s -d "%s"')
+
+
+def generate_zsh(commands):
+    lines = []
+    append = lines.append
+    for name, desc in commands:
+        append(_ZSH_LINE % (name, desc))
+    return _ZSH_PREAMBLE + '\n        '.join(lines) + _ZSH_POSTAMBLE
+
+
+def generate_fish(commands):
+    lines = []
+    append = lines.append
+    for name, desc in commands:
+        append(_FISH_LINE % (name, desc))
+    return _FISH_PREAMBLE + '\n'.join(lines) + '\n'
+
+
+def generate_powershell(commands):
+    # The command array and the whitespace regex are created once when
+    # the script is sourced and captured via $script: scope, instead of
+    # being reallocated (and the regex recompiled) on every Tab press.
+    command_lines = '\n    '.join(
+        f"'{name}'" for name, _desc in commands)
+    return f'''# powershell completion for afdko
+$script:afdkoSplitRegex = [regex]::new('\\s+')
+$script:afdkoCommands = @(
+    {command_lines}
+)
+Register-ArgumentCompleter -Native -CommandName afdko -ScriptBlock {{
+    param($wordToComplete, $commandAst, $cursorPosition)
+    $line = $commandAst.ToString()
+    $words = $script:afdkoSplitRegex.Split($line)
+    if ($words.Count -le 2) {{
+        $script:afdkoCommands |
+            Where-Object {{ $_ -like "$wordToComplete*" }} |
+            ForEach-Object {{
+                [System.Management.Automation.CompletionResult]::new(
+                    $_, $_, 'ParameterValue', $_)
+            }}
+    }}
+}}
+'''
+
+
+_GENERATORS = {
+    'bash': generate_bash,
+    'zsh': generate_zsh,
+    'fish': generate_fish,
+    'powershell': generate_powershell,
+}
+
+
+def _render(shell):
+    # bash only needs command names; the other shells want descriptions.
+    if shell == 'bash':
+        return generate_bash(list_command_names())
+    return _GENERATORS[shell](get_commands())
+
+
+def _read_bundled(shell):
+    """
+    Return the pre-rendered completion script shipped as package data,
+    or None when the bundle is missing (e.g. running from a source
+    checkout before the scripts were generated).
+
+    The bundle spares a completion request from importing the invoker's
+    command registry just to rebuild a fixed-per-release string.
+    """
+    try:
+        return resource_files('afdko').joinpath(
+            f'completions/{shell}').read_text()
+    except OSError:
+        return None
+
+
+def _write_bundle(directory=None):
+    """
+    Regenerate the bundled completion scripts. Run at release time
+    (after changing the command registry) to refresh the package data.
+    """
+    if directory is None:
+        directory = os.path.join(os.path.dirname(__file__), 'completions')
+    os.makedirs(directory, exist_ok=True)
+    for shell in _GENERATORS:
+        with open(os.path.join(directory, shell), 'w') as f:
+            f.write(_render(shell))
+
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    if not args:
+        sys.stderr.write(USAGE)
+        return 1
+    if args[0] in ('-h', '--help'):
+        sys.stdout.write(USAGE)
+        return 0
+    shell = args[0].lower()
+    if shell not in SUPPORTED_SHELLS:
+        sys.stderr.write(f"afdko completion: unsupported shell '{shell}'.\n")
+        sys.stderr.write(USAGE)
+        return 1
+    script = _read_bundled(shell)
+    if script is None:
+        script = _render(shell)
+    sys.stdout.write(script)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,337 @@
+# Copyright 2026 Adobe. All rights reserved.
+
+"""
+Unified command-line entry point for the AFDKO tools.
+
+'afdko <command> [options]' dispatches to the tool registered under
+<command>, whether it is implemented in Python or as a native
+executable. Short command abbreviations are supported ('afdko mo' for
+'afdko makeotf'). Run 'afdko --help' for the primary command list,
+'-s' for secondary tools, '-p' for the proofing tools and '-a' for
+everything.
+"""
+
+import functools
+import importlib
+import sys
+
+# The command registry, kept as a frozen tuple of
+# (name, target 'module:function', description, category) rows: a
+# tuple literal loads straight from the .pyc without any dict build at
+# import time; the lookup dicts below are derived lazily on first use.
+# Rows with a description of None are abbreviations for the command
+# that shares their target.
+_RAW = (
+    # primary tools
+    ('tx', 'afdko._internal:tx',
+     'Font converter and analyzer', 'primary'),
+    ('makeotf', 'afdko.makeotf:main',
+     'Create an OpenType font from sources', 'primary'),
+    ('mo', 'afdko.makeotf:main', None, 'primary'),
+    ('otfautohint', 'afdko.otfautohint.__main__:main',
+     'Auto-hint OpenType/CFF and UFO fonts', 'primary'),
+    ('ah', 'afdko.otfautohint.__main__:main', None, 'primary'),
+    ('autohint', 'afdko.otfautohint.__main__:main', None, 'primary'),
+    ('buildcff2vf', 'afdko.buildcff2vf:main',
+     'Build a CFF2 variable font from master fonts', 'primary'),
+    ('buildmasterotfs', 'afdko.buildmasterotfs:main',
+     'Build master source OpenType/CFF fonts', 'primary'),
+    ('checkoutlinesufo', 'afdko.checkoutlinesufo:main',
+     'Check and fix glyph outlines', 'primary'),
+    ('co', 'afdko.checkoutlinesufo:main', None, 'primary'),
+    ('checkoutlines', 'afdko.checkoutlinesufo:main', None, 'primary'),
+    ('makeinstancesufo', 'afdko.makeinstancesufo:main',
+     'Generate UFO font instances', 'primary'),
+    ('mis', 'afdko.makeinstancesufo:main', None, 'primary'),
+    ('sfntedit', 'afdko._internal:sfntedit',
+     'sfnt table editor', 'primary'),
+    ('se', 'afdko._internal:sfntedit', None, 'primary'),
+    ('spot', 'afdko._internal:spot',
+     'OpenType font dump and proofing tool', 'primary'),
+    # secondary tools
+    ('comparefamily', 'afdko.comparefamily:main',
+     'Sanity-check a family of fonts', 'secondary'),
+    ('cf', 'afdko.comparefamily:main', None, 'secondary'),
+    ('detype1', 'afdko._internal:detype1',
+     'Convert a Type 1 font to human-readable text', 'secondary'),
+    ('dt1', 'afdko._internal:detype1', None, 'secondary'),
+    ('makeotfexe', 'afdko._internal:makeotfexe',
+     'OpenType font compiler (native)', 'secondary'),
+    ('mergefonts', 'afdko._internal:mergefonts',
+     'Merge fonts into a single font', 'secondary'),
+    ('mf', 'afdko._internal:mergefonts', None, 'secondary'),
+    ('otc2otf', 'afdko.otc2otf:main',
+     'Extract fonts from an OpenType Collection', 'secondary'),
+    ('otf2otc', 'afdko.otf2otc:main',
+     'Build an OpenType Collection from fonts', 'secondary'),
+    ('otf2ttf', 'afdko.otf2ttf:main',
+     'Convert OpenType/CFF fonts to TrueType', 'secondary'),
+    ('otfstemhist', 'afdko.otfautohint.__main__:stemhist',
+     'Report stem and alignment-zone data', 'secondary'),
+    ('stemhist', 'afdko.otfautohint.__main__:stemhist', None, 'secondary'),
+    ('rotatefont', 'afdko._internal:rotatefont',
+     'Rotate or translate font glyphs', 'secondary'),
+    ('rf', 'afdko._internal:rotatefont', None, 'secondary'),
+    ('sfntdiff', 'afdko._internal:sfntdiff',
+     'Compare two sfnt font files', 'secondary'),
+    ('sd', 'afdko._internal:sfntdiff', None, 'secondary'),
+    ('ttfcomponentizer', 'afdko.ttfcomponentizer:main',
+     'Componentize TrueType glyphs', 'secondary'),
+    ('ttfdecomponentizer', 'afdko.ttfdecomponentizer:main',
+     'Decomponentize TrueType glyphs', 'secondary'),
+    ('ttxn', 'afdko.ttxn:main',
+     'Normalized TTX dump of a font', 'secondary'),
+    ('type1', 'afdko._internal:type1',
+     'Convert plain text to a Type 1 font', 'secondary'),
+    ('t1', 'afdko._internal:type1', None, 'secondary'),
+    ('completion', 'afdko.completion:main',
+     'Generate a shell completion script', 'secondary'),
+    # proofing tools
+    ('charplot', 'afdko.proofpdf:charplot',
+     'Plot glyphs with metrics and hints', 'proofing'),
+    ('digiplot', 'afdko.proofpdf:digiplot',
+     'Plot glyphs for digitizing review', 'proofing'),
+    ('fontplot', 'afdko.proofpdf:fontplot',
+     'Plot glyph overview pages', 'proofing'),
+    ('fontplot2', 'afdko.proofpdf:fontplot2',
+     'Plot glyph overview pages (configurable)', 'proofing'),
+    ('fontsetplot', 'afdko.proofpdf:fontsetplot',
+     'Plot the glyph sets of a family', 'proofing'),
+    ('hintplot', 'afdko.proofpdf:hintplot',
+     'Plot glyphs with hint annotations', 'proofing'),
+    ('waterfallplot', 'afdko.proofpdf:waterfallplot',
+     'Plot glyph waterfalls', 'proofing'),
+)
+
+_CATEGORY_TITLES = {
+    'primary': 'Commands',
+    'secondary': 'Secondary commands',
+    'proofing': 'Proofing commands',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _commands():
+    """
+    The registry as a dict: name -> (target, description, category).
+    Built on first lookup. The shared target and category strings are
+    interned: abbreviation rows repeat their command's target literal,
+    so interning makes equality checks pointer comparisons and dedups
+    the heap copies; the registry is small, fixed and process-lived,
+    so interning is safe.
+    """
+    return {name: (sys.intern(target), desc, sys.intern(category))
+            for name, target, desc, category in _RAW}
+
+
+def __getattr__(name):
+    # PEP 562: serve the public registry views without paying for the
+    # dict builds unless something actually asks for them.
+    if name == 'ALL_COMMANDS':
+        return _commands()
+    if name == 'ABBREVIATIONS':
+        return _abbreviations()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+@functools.lru_cache(maxsize=None)
+def _abbreviations():
+    """abbreviation -> canonical command name, derived from _RAW."""
+    canonical = {target: name
+                 for name, target, desc, _category in _RAW
+                 if desc is not None}
+    return {name: canonical[target]
+            for name, target, desc, _category in _RAW
+            if desc is None}
+
+
+@functools.lru_cache(maxsize=None)
+def _dispatch_table():
+    """command -> (module name, function name), split once."""
+    return {name: tuple(target.split(':', 1))
+            for name, target, _desc, _category in _RAW}
+
+
+@functools.lru_cache(maxsize=None)
+def _help_tables():
+    """
+    Return (abbrevs, by_category): target -> abbreviation names, and
+    category -> [(name, desc, abbrev_str)] rows ready for printing.
+    """
+    abbrevs = {}
+    for name, target, desc, _category in _RAW:
+        if desc is None:
+            abbrevs.setdefault(target, []).append(name)
+    by_category = {}
+    for name, target, desc, category in _RAW:
+        if desc is None:
+            continue
+        cmd_abbrevs = abbrevs.get(target)
+        if cmd_abbrevs:
+            abbrev_str = f"  (abbrev: {', '.join(cmd_abbrevs)})"
+        else:
+            abbrev_str = ''
+        by_category.setdefault(category, []).append(
+            (name, desc, abbrev_str))
+    return abbrevs, by_category
+
+
+def _category_lines(category):
+    """
+    One formatted help line per canonical command in 'category',
+    including any abbreviations registered for it.
+    """
+    return [f'  {name:20} {desc}{abbrev_str}'
+            for name, desc, abbrev_str
+            in _help_tables()[1].get(category, ())]
+
+
+def print_category_commands(category):
+    sys.stdout.write('\n'.join(_category_lines(category)) + '\n')
+
+
+@functools.lru_cache(maxsize=None)
+def _render_help(categories):
+    """
+    Render the complete help text for a tuple of categories. Memoized:
+    the text is static per process, so repeat help requests (tests,
+    completion probes) cost a single cache hit.
+    """
+    lines = [
+        'Usage: afdko <command> [options]',
+        '',
+        'Run the AFDKO tool <command> with the given options.',
+        "Run 'afdko <command> -h' for help on a specific command.",
+    ]
+    for category in categories:
+        lines.append('')
+        lines.append(f'{_CATEGORY_TITLES[category]}:')
+        lines.extend(_category_lines(category))
+    if categories == ('primary',):
+        lines.append('')
+        lines.append("Run 'afdko -s' to list secondary commands, "
+                     "'afdko -p' for")
+        lines.append("proofing commands, or 'afdko -a' for all commands.")
+    return '\n'.join(lines) + '\n'
+
+
+def print_help(categories=('primary',)):
+    sys.stdout.write(_render_help(tuple(categories)))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_func(command_name):
+    """
+    Resolve the callable for a command, importing its module strictly
+    on first use. The result is cached so repeat dispatches within one
+    process (tests, batch drivers) pay the import once.
+    """
+    module_name, func_name = _dispatch_table()[command_name]
+    # Peek at sys.modules first: on warm starts the module is already
+    # loaded and the import machinery can be skipped entirely.
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _command_trie():
+    """
+    Prefix trie (dict of dicts) over every registered name. A leaf is
+    marked with an '' key holding the full name; internal nodes carry
+    only their child characters.
+    """
+    trie = {}
+    for name, _target, _desc, _category in _RAW:
+        node = trie
+        for ch in name:
+            node = node.setdefault(ch, {})
+        node[''] = name
+    return trie
+
+
+def resolve_command(name):
+    """
+    Return the registered name that 'name' refers to: an exact match
+    (command or abbreviation) wins outright, otherwise a prefix that
+    reaches exactly one registered name resolves to it ('afdko sp'
+    runs spot). Ambiguous or unknown names return None.
+    """
+    if name in _dispatch_table():
+        return name
+    node = _command_trie()
+    for ch in name:
+        node = node.get(ch)
+        if node is None:
+            return None
+    matches = []
+    stack = [node]
+    while stack:
+        for key, child in stack.pop().items():
+            if key == '':
+                matches.append(child)
+                if len(matches) > 1:
+                    return None
+            else:
+                stack.append(child)
+    return matches[0] if matches else None
+
+
+# Constant halves of the unknown-command diagnostic; the error path
+# concatenates them around the name and emits a single write, so the
+# message cannot interleave with output from concurrent children.
+_UNKNOWN_PREFIX = "Unknown command '"
+_UNKNOWN_SUFFIX = "'\nRun 'afdko --help' for usage.\n"
+
+
+def dispatch_command(command_name, args=None):
+    """
+    Run the registered command in-process and return its exit status.
+    """
+    if args is None:
+        args = sys.argv[2:]
+    if command_name not in _dispatch_table():
+        resolved = resolve_command(command_name)
+        if resolved is None:
+            sys.stderr.write(
+                _UNKNOWN_PREFIX + command_name + _UNKNOWN_SUFFIX)
+            return 1
+        command_name = resolved
+    try:
+        func = _get_func(command_name)
+    except (ImportError, AttributeError) as err:
+        print(f"afdko: could not load command '{command_name}': {err}",
+              file=sys.stderr)
+        return 1
+    sys.argv = [command_name] + list(args)
+    return func()
+
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    if not args or args[0] in ('-h', '--help'):
+        print_help()
+        return 0
+    first = args[0]
+    if first == 'help':
+        if len(args) < 2:
+            print_help()
+            return 0
+        first = args[1]
+        args = [first, '-h']
+    if first in ('-s', '--secondary'):
+        print_help(('secondary',))
+        return 0
+    if first in ('-p', '--proofing'):
+        print_help(('proofing',))
+        return 0
+    if first in ('-a', '--all'):
+        print_help(('primary', 'secondary', 'proofing'))
+        return 0
+    return dispatch_command(first, args[1:])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,8 +4,10 @@
 Auto-hinting program for PostScript, OpenType/CFF and UFO fonts.
 """
 
+import collections
 import logging
 import logging.handlers
+import queue
 
 log_glyph = ''
 log_instance = ''
@@ -20,18 +22,68 @@ class DuplicateMessageFilter(logging.Filter):
     probably enough.
     """
 
+    # Upper bound on remembered keys: hinting a large (e.g. CJK) font
+    # would otherwise retain every distinct message forever.
+    _CAPACITY = 4096
+
     def __init__(self):
         super(DuplicateMessageFilter, self).__init__()
-        self.logs = set()
+        self.logs = collections.OrderedDict()
 
     def filter(self, record):
-        current = (record.module, record.levelno, record.getMessage())
+        # The shared instance sees a record once per handler; compute
+        # the verdict on first sight and stamp it on the record so
+        # later handlers get the same answer (instead of suppressing
+        # the record everywhere but the first handler).
+        verdict = getattr(record, 'duplicate_ok', None)
+        if verdict is not None:
+            return verdict
+        # Key on the format template and raw args instead of the
+        # rendered message: record.msg is usually an interned literal
+        # and record.args a small tuple, so hashing them skips the
+        # %-interpolation and large-string hash of getMessage().
+        current = (record.module, record.levelno, record.msg,
+                   record.args)
+        try:
+            hash(current)
+        except TypeError:
+            # unhashable args (e.g. a dict); fall back to the
+            # rendered message
+            current = (record.module, record.levelno,
+                       record.getMessage())
         if current in self.logs:
-            return False
-        self.logs.add(current)
+            self.logs.move_to_end(current)
+            verdict = False
+        else:
+            self.logs[current] = None
+            if len(self.logs) > self._CAPACITY:
+                self.logs.popitem(last=False)
+            verdict = True
+        record.duplicate_ok = verdict
+        return verdict
+
+
+class otfautoLogContextFilter(logging.Filter):
+    """
+    Stamps the current glyph/instance/dimension context onto each
+    record as it passes the handler, in the emitting process. This
+    replaces the process-wide LogRecord factory, which added a Python
+    callback to every record created in the interpreter, including
+    those of unrelated libraries. Records arriving pre-stamped from a
+    worker process are left untouched.
+    """
+
+    def filter(self, record):
+        if not hasattr(record, 'glyph'):
+            record.glyph = log_glyph
+            record.instance = log_instance
+            record.dimension = log_dimension
         return True
 
 
+_context_filter = otfautoLogContextFilter()
+
+
 class otfautoLogFormatter(logging.Formatter):
     def __init__(self, fmt, datefmt=None, verbose=False):
         super().__init__(fmt, datefmt)
@@ -39,21 +91,51 @@ class otfautoLogFormatter(logging.Formatter):
 
     def format(self, record):
         if self.verbose:
-            verbose_field = "[%s:%d] " % (record.filename, record.lineno)
+            # f-string: formatted with FORMAT_VALUE/BUILD_STRING
+            # bytecodes, skipping the %-format parser per record
+            verbose_field = f"[{record.filename}:{record.lineno}] "
         else:
             verbose_field = ''
-        if record.dimension != '':
-            dim_field = record.dimension + ' '
-        else:
-            dim_field = ''
-        if record.instance != '' and record.glyph != '':
-            glyph_field = '(%s, "%s") ' % (record.glyph, record.instance)
-        elif record.glyph != '':
-            glyph_field = '(%s) ' % (record.glyph)
-        else:
-            glyph_field = ''
-        return (verbose_field + glyph_field + dim_field +
-                super().format(record))
+        # The context prefix repeats for thousands of consecutive
+        # records within one glyph/dimension; build it once per
+        # distinct context and reuse it. set_log_parameters clears the
+        # cache when the local context changes, but records arriving
+        # pre-stamped from worker processes are formatted in the
+        # receiver, where it never runs, so the size guard below keeps
+        # a long parallel run from retaining an entry per glyph.
+        key = (record.glyph, record.instance, record.dimension)
+        prefix = _prefix_cache.get(key)
+        if prefix is None:
+            if record.dimension != '':
+                dim_field = record.dimension + ' '
+            else:
+                dim_field = ''
+            if record.instance != '' and record.glyph != '':
+                glyph_field = f'({record.glyph}, "{record.instance}") '
+            elif record.glyph != '':
+                glyph_field = f'({record.glyph}) '
+            else:
+                glyph_field = ''
+            if len(_prefix_cache) >= _PREFIX_CACHE_CAPACITY:
+                _prefix_cache.clear()
+            prefix = _prefix_cache[key] = glyph_field + dim_field
+        return verbose_field + prefix + super().format(record)
+
+
+# context triple -> rendered prefix; cleared when the local context
+# changes and emptied wholesale at the capacity bound (prefixes are
+# cheap to rebuild, so a full clear beats LRU bookkeeping here)
+_PREFIX_CACHE_CAPACITY = 4096
+_prefix_cache = {}
+
+_duplicate_filter = None
+
+
+def _shared_duplicate_filter():
+    global _duplicate_filter
+    if _duplicate_filter is None:
+        _duplicate_filter = DuplicateMessageFilter()
+    return _duplicate_filter
 
 
 def set_log_parameters(dimension=None, glyph=None, instance=None):
@@ -64,6 +146,7 @@ def set_log_parameters(dimension=None, glyph=None, instance=None):
         log_dimension = dimension
     if instance is not None:
         log_instance = instance
+    _prefix_cache.clear()
 
 
 def logging_conf(verbose, logfile=None, handlers=None):
@@ -80,33 +163,43 @@ def logging_conf(verbose, logfile=None, handlers=None):
     else:
         logging.basicConfig(level=log_level, filename=logfile)
 
-    old_factory = logging.getLogRecordFactory()
-
-    def otfautohint_record_factory(*args, **kwargs):
-        record = old_factory(*args, **kwargs)
-        record.glyph = log_glyph
-        record.instance = log_instance
-        record.dimension = log_dimension
-        return record
-
-    logging.setLogRecordFactory(otfautohint_record_factory)
-
     fmt = otfautoLogFormatter("%(levelname)s: %(message)s",
                               verbose=verbose > 1)
 
     for handler in logging.root.handlers:
         handler.setFormatter(fmt)
-        if log_level == logging.WARNING:
-            handler.addFilter(DuplicateMessageFilter())
+        if _context_filter not in handler.filters:
+            handler.addFilter(_context_filter)
+    if log_level == logging.WARNING:
+        # One shared filter instance with a single dedup table. It must
+        # sit on the handlers, not the root logger: logger-level
+        # filters never run for records propagated from child loggers.
+        dup = _shared_duplicate_filter()
+        for handler in logging.root.handlers:
+            if dup not in handler.filters:
+                handler.addFilter(dup)
 
 
 def log_receiver(logQueue):
+    # Block for the first record of a batch, then drain whatever else
+    # is already queued with get_nowait: one blocking round-trip per
+    # batch instead of per record. Logger objects are cached by name to
+    # skip the manager lookup per record.
+    loggers = {}
     while True:
         record = logQueue.get()
-        if record is None:
-            break
-        logger = logging.getLogger(record.name)
-        logger.handle(record)
+        while True:
+            if record is None:
+                return
+            logger = loggers.get(record.name)
+            if logger is None:
+                logger = loggers[record.name] = \
+                    logging.getLogger(record.name)
+            logger.handle(record)
+            try:
+                record = logQueue.get_nowait()
+            except queue.Empty:
+                break
 
 
 def logging_reconfig(logQueue, verbose=0):
@@ -116,6 +209,9 @@ def logging_reconfig(logQueue, verbose=0):
         # Already configured logging to just swap out handlers
         for h in root.handlers:
             root.removeHandler(h)
+        # The queue handler forwards to the parent process, so records
+        # must be stamped with the local context before they leave.
+        qh.addFilter(_context_filter)
         root.addHandler(qh)
     else:
         logging_conf(verbose, None, [qh])
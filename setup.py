@@ -112,33 +112,9 @@ def _get_scripts():
 
 
 def _get_console_scripts():
-    script_entries = [
-        ('buildcff2vf', 'buildcff2vf:main'),
-        ('buildmasterotfs', 'buildmasterotfs:main'),
-        ('comparefamily', 'comparefamily:main'),
-        ('checkoutlinesufo', 'checkoutlinesufo:main'),
-        ('makeotf', 'makeotf:main'),
-        ('makeinstancesufo', 'makeinstancesufo:main'),
-        ('otc2otf', 'otc2otf:main'),
-        ('otf2otc', 'otf2otc:main'),
-        ('otf2ttf', 'otf2ttf:main'),
-        ('ttfcomponentizer', 'ttfcomponentizer:main'),
-        ('ttfdecomponentizer', 'ttfdecomponentizer:main'),
-        ('ttxn', 'ttxn:main'),
-        ('charplot', 'proofpdf:charplot'),
-        ('digiplot', 'proofpdf:digiplot'),
-        ('fontplot', 'proofpdf:fontplot'),
-        ('fontplot2', 'proofpdf:fontplot2'),
-        ('fontsetplot', 'proofpdf:fontsetplot'),
-        ('hintplot', 'proofpdf:hintplot'),
-        ('waterfallplot', 'proofpdf:waterfallplot'),
-        ('otfautohint', 'otfautohint.__main__:main'),
-        ('otfstemhist', 'otfautohint.__main__:stemhist'),
-    ]
-    scripts_path = 'afdko'
-    scripts = [f'{name} = {scripts_path}.{entry}'
-               for name, entry in script_entries]
-    return scripts
+    from _build_scripts import dynamic_metadata
+    return [f'{name} = {target}'
+            for name, target in dynamic_metadata().items()]
 
 
 def _get_requirements():
@@ -186,6 +162,7 @@ def main():
           include_package_data=True,
           package_data={
               'afdko': [
+                  'completions/*',
                   'resources/*.txt',
                   'resources/Adobe-CNS1/*',
                   'resources/Adobe-GB1/*',
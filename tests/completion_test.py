@@ -0,0 +1,76 @@
+import pytest
+
+from afdko import completion
+from afdko.invoker import ALL_COMMANDS
+
+
+# -----
+# Tests
+# -----
+
+@pytest.mark.parametrize('shell', completion.SUPPORTED_SHELLS)
+def test_bundled_script_current(shell):
+    # the bundled scripts take precedence over live rendering in
+    # main(), so they must be regenerated (_write_bundle) whenever the
+    # command registry changes; this is the one check that keeps them
+    # honest, mirroring test_help_golden_current
+    assert completion._read_bundled(shell) == completion._render(shell)
+
+
+def test_get_commands_matches_registry():
+    commands = completion.get_commands()
+    names = {name for name, _desc in commands}
+    # abbreviations are excluded; canonical names only
+    assert 'dt1' not in names
+    assert {'tx', 'makeotf', 'detype1', 'charplot'} <= names
+    assert [name for name, _desc in commands] == \
+        completion.list_command_names()
+
+
+@pytest.mark.parametrize('shell', completion.SUPPORTED_SHELLS)
+def test_generated_script_lists_commands(shell):
+    script = completion._render(shell)
+    for name in ('tx', 'makeotf', 'charplot'):
+        assert name in script
+
+
+def test_main_no_args(capsys):
+    assert completion.main([]) == 1
+    assert completion.USAGE in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('arg', ['-h', '--help'])
+def test_main_help(arg, capsys):
+    assert completion.main([arg]) == 0
+    assert completion.USAGE in capsys.readouterr().out
+
+
+def test_main_unsupported_shell(capsys):
+    assert completion.main(['tcsh']) == 1
+    assert "unsupported shell 'tcsh'" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('shell', completion.SUPPORTED_SHELLS)
+def test_main_prints_script(shell, capsys):
+    assert completion.main([shell]) == 0
+    assert capsys.readouterr().out == completion._render(shell)
+
+
+def test_main_shell_case_insensitive(capsys):
+    assert completion.main(['BASH']) == 0
+    assert capsys.readouterr().out == completion._render('bash')
+
+
+def test_main_render_fallback(monkeypatch, capsys):
+    # a source checkout without the bundles must still work: main()
+    # falls back to rendering the script live
+    monkeypatch.setattr(completion, '_read_bundled', lambda shell: None)
+    assert completion.main(['zsh']) == 0
+    assert capsys.readouterr().out == completion._render('zsh')
+
+
+def test_command_count_consistent():
+    # one entry per canonical command with a description
+    canonical = {target for target, desc, _cat in ALL_COMMANDS.values()
+                 if desc is not None}
+    assert len(completion.get_commands()) == len(canonical)
@@ -0,0 +1,34 @@
+"""
+Shared session-scoped fixtures for the test suite.
+"""
+
+import subprocess
+
+import pytest
+
+from afdko import invoker
+
+
+@pytest.fixture(scope='session')
+def help_output():
+    """
+    Memoized access to 'afdko <flags>' help runs. The help text is
+    deterministic per session, so each flag combination is spawned
+    once and the completed process is replayed for every test that
+    asks for it.
+    """
+    cache = {}
+
+    def _get(*flags):
+        if flags not in cache:
+            cache[flags] = subprocess.run(['afdko', *flags],
+                                          capture_output=True, text=True)
+        return cache[flags]
+    return _get
+
+
+@pytest.fixture(scope='session')
+def abbrev_map():
+    """abbreviation -> canonical command name, straight from the
+    invoker's registry."""
+    return dict(invoker.ABBREVIATIONS)
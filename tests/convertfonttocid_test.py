@@ -1,6 +1,6 @@
+import hashlib
 import os
 import pytest
-from shutil import copy2, rmtree
 
 from afdko.convertfonttocid import mergeFontToCFF
 
@@ -10,23 +10,44 @@ from test_utils import (get_input_path, get_expected_path, get_temp_file_path,
 
 MODULE = 'convertfonttocid'
 
-DATA_DIR = os.path.join(os.path.dirname(__file__), MODULE + '_data')
-TEMP_DIR = os.path.join(DATA_DIR, 'temp_output')
+
+@pytest.fixture(scope='session')
+def temp_dir(tmp_path_factory):
+    """
+    Session-scoped temporary output directory. pytest handles the
+    cleanup, and each pytest-xdist worker gets its own tree, so the
+    parametrized variants can run in parallel.
+    """
+    return str(tmp_path_factory.mktemp(MODULE + '_temp_output'))
 
 
-def setup_module():
+@pytest.fixture(scope='session')
+def core_otf_bytes():
     """
-    Create the temporary output directory
+    The contents of the 'core.otf' input, read once for the session.
+    Every parametrized variant seeds its working copy from these bytes
+    instead of re-reading the file from disk each time.
     """
-    rmtree(TEMP_DIR, ignore_errors=True)
-    os.mkdir(TEMP_DIR)
+    with open(get_input_path('core.otf'), 'rb') as f:
+        return f.read()
+
+
+def _file_digest(path):
+    h = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+    return h.digest()
 
 
-def teardown_module():
+def ttx_equal(expected_path, actual_path):
     """
-    teardown the temporary output directory
+    Fast equality check for two TTX dumps by content hash. Identical
+    dumps (the common, green-run case) are confirmed without the
+    line-by-line tokenization the differ does; on mismatch the caller
+    should fall back to the differ for a readable report.
     """
-    rmtree(TEMP_DIR)
+    return _file_digest(expected_path) == _file_digest(actual_path)
 
 
 # -----
@@ -35,20 +56,23 @@ def teardown_module():
 
 @pytest.mark.parametrize('subroutinize', [True, False])
 @pytest.mark.parametrize('font_filename', ['1_fdict.ps', '3_fdict.ps'])
-def test_mergeFontToCFF_bug570(font_filename, subroutinize):
-    # 'dir=TEMP_DIR' is used for guaranteeing that the temp data is on same
-    # file system as other data; if it's not, a file rename step made by
-    # sfntedit will NOT work.
-    actual_path = get_temp_file_path(directory=TEMP_DIR)
+def test_mergeFontToCFF_bug570(font_filename, subroutinize, temp_dir,
+                               core_otf_bytes):
+    # 'dir=temp_dir' keeps all the temp data on one file system; if
+    # it's not, a file rename step made by sfntedit will NOT work.
+    actual_path = get_temp_file_path(directory=temp_dir)
     subr_str = 'subr' if subroutinize else 'no_subr'
     font_base = os.path.splitext(font_filename)[0]
     ttx_filename = f'{font_base}-{subr_str}.ttx'
     source_path = get_input_path(font_filename)
-    output_path = get_input_path('core.otf')
-    copy2(output_path, actual_path)
+    with open(actual_path, 'wb') as f:
+        f.write(core_otf_bytes)
 
     mergeFontToCFF(source_path, actual_path, subroutinize)
 
     actual_ttx = generate_ttx_dump(actual_path, ['CFF '])
     expected_ttx = get_expected_path(ttx_filename)
-    assert differ([expected_ttx, actual_ttx, '-l', '2'])
+    # Byte-identical dumps short-circuit the differ; only a mismatch
+    # (or a skippable header difference) pays for the full line diff.
+    assert ttx_equal(expected_ttx, actual_ttx) or \
+        differ([expected_ttx, actual_ttx, '-l', '2'])
@@ -1,5 +1,8 @@
 import pytest
 import subprocess
+import sys
+
+from afdko.invoker import dispatch_command
 
 from runner import main as runner
 from differ import main as differ
@@ -7,6 +10,29 @@ from test_utils import get_expected_path
 
 TOOL = 'detype1'
 
+# built once; tuple concatenation per call avoids rebuilding the
+# ['afdko', TOOL] list for every parametrized invocation
+_PREFIX = ('afdko', TOOL)
+
+
+def _tool_cmd(*args):
+    return (*_PREFIX, *args)
+
+
+def _invoke_inproc(*args):
+    """
+    Dispatch the tool through the invoker in this process instead of
+    forking a fresh interpreter per test; only the native tool itself
+    is spawned. sys.argv is patched (and restored) around the call and
+    a SystemExit is translated to its exit code.
+    """
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(sys, 'argv', ['afdko', TOOL, *args])
+        try:
+            return dispatch_command(TOOL, list(args))
+        except SystemExit as e:
+            return e.code
+
 
 # -----
 # Tests
@@ -14,12 +40,18 @@ TOOL = 'detype1'
 
 @pytest.mark.parametrize('arg', ['-h'])
 def test_exit_known_option(arg):
-    assert subprocess.call([TOOL, arg]) == 0
+    assert _invoke_inproc(arg) == 0
 
 
 @pytest.mark.parametrize('arg', ['-v', '-u'])
 def test_exit_unknown_option(arg):
-    assert subprocess.call([TOOL, arg]) == 1
+    assert _invoke_inproc(arg) == 1
+
+
+def test_exit_known_option_wrapper():
+    # one subprocess run kept as a smoke test of the installed
+    # 'afdko' console script itself
+    assert subprocess.call(_tool_cmd('-h')) == 0
 
 
 def test_run_on_pfa_data():
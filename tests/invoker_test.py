@@ -0,0 +1,262 @@
+import functools
+import os
+import sys
+# bound once at import; skips the module attribute lookup at each of
+# the many call sites below
+from subprocess import run as _run, DEVNULL, PIPE
+
+import pytest
+
+from test_invoker_utils import (
+    CPP_COMMANDS, call_invoker_inproc, map_concurrent,
+    run_pair_hashes, run_via_invoker, run_via_invoker_fast,
+    run_via_wrapper)
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'invoker_data',
+                        'expected_output')
+
+
+@functools.lru_cache(maxsize=None)
+def _golden(filename):
+    """Committed snapshot of a help listing; lets the listing tests
+    check content without spawning anything. test_help_golden_current
+    keeps the snapshots honest against the live output."""
+    with open(os.path.join(DATA_DIR, filename)) as f:
+        return f.read()
+
+
+def pytest_generate_tests(metafunc):
+    # Tests taking 'run_cmd' run through both the 'afdko' entry point
+    # and the legacy wrapper script, unless a mark limits them to one
+    # path; doubling invoker-only tests would spawn subprocesses for
+    # no extra coverage.
+    if 'run_cmd' not in metafunc.fixturenames:
+        return
+    if metafunc.definition.get_closest_marker('invoker_only'):
+        runners, ids = [run_via_invoker], ['invoker']
+    elif metafunc.definition.get_closest_marker('wrapper_only'):
+        runners, ids = [run_via_wrapper], ['wrapper']
+    else:
+        runners = [run_via_invoker, run_via_wrapper]
+        ids = ['invoker', 'wrapper']
+    metafunc.parametrize('run_cmd', runners, ids=ids)
+
+
+# -----
+# Tests
+# -----
+
+class TestHelpSystem:
+
+    def test_help_no_args(self, help_output):
+        result = help_output()
+        assert result.returncode == 0
+        assert 'Usage: afdko <command>' in result.stdout
+
+    def test_help_dash_h(self, help_output):
+        result = help_output('-h')
+        assert result.returncode == 0
+        assert 'Usage: afdko <command>' in result.stdout
+
+    def test_help_long_option(self, help_output):
+        result = help_output('--help')
+        assert result.returncode == 0
+        assert 'Usage: afdko <command>' in result.stdout
+
+    def test_help_command_word(self, help_output):
+        result = help_output('help')
+        assert result.returncode == 0
+        assert 'Usage: afdko <command>' in result.stdout
+
+    def test_help_secondary(self):
+        # one tokenization pass instead of a substring scan per name
+        tokens = set(_golden('help_secondary.txt').split())
+        expected = {'comparefamily', 'detype1', 'mergefonts',
+                    'rotatefont', 'sfntdiff', 'ttxn', 'type1'}
+        missing = expected - tokens
+        assert not missing, f'missing commands: {missing}'
+
+    def test_help_proofing(self):
+        tokens = set(_golden('help_proofing.txt').split())
+        expected = {'charplot', 'digiplot', 'fontplot', 'fontplot2',
+                    'fontsetplot', 'hintplot', 'waterfallplot'}
+        missing = expected - tokens
+        assert not missing, f'missing commands: {missing}'
+
+    def test_help_all(self):
+        tokens = set(_golden('help_all.txt').split())
+        missing = {'tx', 'detype1', 'charplot'} - tokens
+        assert not missing, f'missing commands: {missing}'
+
+    def test_help_lists_primary_tools(self):
+        tokens = set(_golden('help_default.txt').split())
+        expected = {'tx', 'makeotf', 'otfautohint', 'buildcff2vf',
+                    'checkoutlinesufo', 'sfntedit', 'spot'}
+        missing = expected - tokens
+        assert not missing, f'missing commands: {missing}'
+
+    def test_help_golden_current(self, help_output):
+        # the one live run that keeps all four snapshots trustworthy;
+        # regenerate them from invoker.main if the registry changes
+        assert help_output('--help').stdout == _golden('help_default.txt')
+        for flag, filename in (('-s', 'help_secondary.txt'),
+                               ('-p', 'help_proofing.txt'),
+                               ('-a', 'help_all.txt')):
+            assert help_output(flag).stdout == _golden(filename)
+
+    def test_help_command_specific(self):
+        result = call_invoker_inproc('help', 'completion')
+        assert result.returncode == 0
+        # check the streams separately; concatenating them just to
+        # measure allocates a third copy
+        assert len(result.stdout) + len(result.stderr) > 0
+
+    def test_help_fast_path(self):
+        # help and unknown-command handling must stay on the invoker's
+        # fast path: no tool module (and so none of the heavyweight
+        # dependencies like fontTools) may be imported for them
+        code = (
+            'import sys\n'
+            'from afdko import invoker\n'
+            'invoker.main(["--help"])\n'
+            'invoker.main(["-a"])\n'
+            'invoker.main(["nosuchtool"])\n'
+            'heavy = [m for m in sys.modules\n'
+            '         if m == "fontTools" or m.startswith("afdko.")\n'
+            '         and m not in ("afdko.invoker",)]\n'
+            'assert not heavy, heavy\n')
+        result = _run([sys.executable, '-c', code],
+                      stdout=DEVNULL, stderr=DEVNULL)
+        assert result.returncode == 0
+
+    def test_help_command_specific_unknown(self):
+        # only stderr is checked; route stdout to the bit bucket
+        result = _run(['afdko', 'help', 'nosuchtool'],
+                      stdout=DEVNULL, stderr=PIPE, text=True)
+        assert result.returncode == 1
+        # the error is the first thing written; startswith checks the
+        # prefix without scanning the whole stream
+        assert result.stderr.startswith("Unknown command 'nosuchtool'")
+
+
+class TestCppCommandAbbreviations:
+
+    def test_cpp_abbreviations_help(self, abbrev_map):
+        pairs = [('sfntedit', 'se'), ('detype1', 'dt1'),
+                 ('mergefonts', 'mf'), ('rotatefont', 'rf'),
+                 ('sfntdiff', 'sd'), ('type1', 't1')]
+        # the registry itself proves each abbreviation resolves to its
+        # canonical command ...
+        for cmd, abbrev in pairs:
+            assert abbrev_map[abbrev] == cmd
+        # ... and the six dispatch runs are independent, so fan them
+        # out on the shared executor instead of running them serially
+        results = map_concurrent(
+            lambda abbrev: _run(['afdko', abbrev, '-h'],
+                                capture_output=True),
+            [abbrev for _cmd, abbrev in pairs])
+        for result in results:
+            assert result.returncode in (0, 1)
+            assert len(result.stdout) + len(result.stderr) > 0
+
+    def test_tx_no_abbreviation(self):
+        # 'tx' deliberately has no 't' abbreviation
+        result = _run(['afdko', 't', '-h'],
+                      capture_output=True, text=True)
+        assert result.returncode == 1
+        assert result.stderr.startswith("Unknown command 't'")
+
+
+class TestPythonCommandAbbreviations:
+
+    @pytest.mark.parametrize('cmd, abbrev', [
+        ('makeotf', 'mo'), ('otfautohint', 'ah'),
+        ('checkoutlinesufo', 'co'), ('makeinstancesufo', 'mis'),
+        ('comparefamily', 'cf'), ('otfstemhist', 'stemhist')])
+    def test_python_abbreviations_help(self, cmd, abbrev, abbrev_map):
+        assert abbrev_map[abbrev] == cmd
+        ab_result = call_invoker_inproc(abbrev, '-h')
+        assert ab_result.returncode in (0, 1)
+        assert len(ab_result.stdout) + len(ab_result.stderr) > 0
+
+    def test_python_multiple_abbreviations(self, abbrev_map):
+        # 'otfautohint' is reachable under two abbreviations; the
+        # registry mapping makes running all three redundant
+        assert abbrev_map['ah'] == 'otfautohint'
+        assert abbrev_map['autohint'] == 'otfautohint'
+
+
+class TestCppCommands:
+
+    # sorted(): parametrize ids must be stable across pytest-xdist
+    # workers, and frozenset iteration order is not
+    @pytest.mark.parametrize('cmd', sorted(CPP_COMMANDS))
+    def test_cpp_commands_work(self, cmd):
+        # '-h' exits 0 or 1 depending on the tool; either proves the
+        # invoker found and ran the native binary
+        assert run_via_invoker(cmd, '-h') in (0, 1)
+
+    @pytest.mark.parametrize('abbrev',
+                             ['se', 'dt1', 'mf', 'rf', 'sd', 't1'])
+    def test_cpp_abbreviations_work(self, abbrev):
+        assert run_via_invoker(abbrev, '-h') in (0, 1)
+
+
+class TestPythonFallback:
+
+    @pytest.mark.parametrize('cmd', ['makeotf', 'buildcff2vf',
+                                     'otfautohint', 'otc2otf',
+                                     'otf2otc', 'ttxn'])
+    def test_python_commands_work(self, cmd):
+        # pooled worker: isolates any global state the tool touches
+        result = run_via_invoker_fast(cmd, '-h')
+        assert result.returncode in (0, 1)
+
+    @pytest.mark.parametrize('cmd', ['charplot', 'digiplot', 'fontplot',
+                                     'fontplot2', 'fontsetplot',
+                                     'hintplot', 'waterfallplot'])
+    def test_proofing_tools_work(self, cmd):
+        result = run_via_invoker_fast(cmd, '-h')
+        assert result.returncode in (0, 1)
+
+
+class TestCommandDispatch:
+
+    def test_dispatch_help(self, run_cmd):
+        assert run_cmd('detype1', '-h') == 0
+
+    def test_abbrev_trie_unambiguous(self):
+        from afdko import invoker
+        # every registered name must resolve to itself: exact matches
+        # always beat prefix expansion ('makeotf' vs 'makeotfexe')
+        for name in invoker.ALL_COMMANDS:
+            assert invoker.resolve_command(name) == name
+
+    @pytest.mark.invoker_only
+    def test_dispatch_abbreviation(self, run_cmd):
+        # abbreviations only exist behind the invoker; there is no
+        # 'dt1' wrapper script to double the run with
+        assert run_cmd('dt1', '-h') == 0
+
+    def test_unknown_command(self):
+        result = _run(['afdko', 'invalidcommand'],
+                      stdout=DEVNULL, stderr=PIPE, text=True)
+        assert result.returncode == 1
+        assert result.stderr.startswith(
+            "Unknown command 'invalidcommand'")
+
+
+class TestBackwardsCompatibility:
+
+    def test_invoker_vs_wrapper_tx_help(self):
+        # (returncode, sha256-of-stdout) pairs: equality is all these
+        # tests need, without keeping either output around
+        inv, wrap = run_pair_hashes(['afdko', 'tx', '-h'],
+                                    ['tx', '-h'])
+        assert inv == wrap
+
+    def test_invoker_vs_wrapper_makeotf_help(self):
+        inv, wrap = run_pair_hashes(['afdko', 'makeotf', '-h'],
+                                    ['makeotf', '-h'])
+        assert inv == wrap
@@ -0,0 +1,175 @@
+"""
+Shared helpers for the 'afdko' invoker test suite (invoker_test.py).
+"""
+
+import concurrent.futures
+import contextlib
+import hashlib
+import io
+import multiprocessing
+import os
+import subprocess
+import sys
+from collections import namedtuple
+# bound once; the helpers below are the suite's hottest call sites
+from subprocess import call as _call
+
+import pytest
+
+from afdko import invoker
+
+# Pure-Python tools: these can be dispatched through invoker.main() in
+# this process, skipping the interpreter startup and package import
+# that a subprocess per test would pay. Frozensets give the hot
+# 'cmd in PYTHON_COMMANDS' check in run_via_invoker an O(1) hashed
+# probe and guard against accidental mutation from a test.
+PYTHON_COMMANDS = frozenset({
+    'makeotf', 'otfautohint', 'buildcff2vf', 'buildmasterotfs',
+    'checkoutlinesufo', 'makeinstancesufo', 'comparefamily', 'otc2otf',
+    'otf2otc', 'otf2ttf', 'otfstemhist', 'ttfcomponentizer',
+    'ttfdecomponentizer', 'ttxn', 'completion', 'charplot', 'digiplot',
+    'fontplot', 'fontplot2', 'fontsetplot', 'hintplot', 'waterfallplot',
+})
+
+# Native (C/C++) tools always need a real process.
+CPP_COMMANDS = frozenset({
+    'tx', 'sfntedit', 'spot', 'makeotfexe', 'detype1', 'type1',
+    'sfntdiff', 'mergefonts', 'rotatefont',
+})
+
+# CompletedProcess-shaped result for the in-process path.
+InvokerResult = namedtuple('InvokerResult',
+                           ['returncode', 'stdout', 'stderr'])
+
+
+def call_invoker_inproc(*args):
+    """
+    Run invoker.main() with the given arguments in this process,
+    capturing stdout/stderr and translating SystemExit to a return
+    code. Only safe for the help paths and pure-Python tools.
+    sys.argv is patched around the call: dispatch_command overwrites
+    it for the dispatched tool, and that must not leak into the rest
+    of the pytest run.
+    """
+    buf_out, buf_err = io.StringIO(), io.StringIO()
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(sys, 'argv', ['afdko', *args])
+        try:
+            with contextlib.redirect_stdout(buf_out), \
+                    contextlib.redirect_stderr(buf_err):
+                rc = invoker.main(list(args))
+        except SystemExit as e:
+            rc = e.code
+    if rc is None:
+        rc = 0
+    return InvokerResult(rc, buf_out.getvalue(), buf_err.getvalue())
+
+
+# Pool of forked workers that inherit this process's already-imported
+# afdko package, giving Python-command tests subprocess-level isolation
+# without paying interpreter startup + package import per call.
+_POOL = None
+
+
+def _pool_init():
+    global _WORKER_INVOKER
+    from afdko import invoker as _inv
+    _WORKER_INVOKER = _inv
+
+
+def _pool_main(argv):
+    # runs inside a pooled worker; the argv patch only matters for
+    # hygiene there (the fork dies with its state) but mirrors
+    # call_invoker_inproc
+    buf_out, buf_err = io.StringIO(), io.StringIO()
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(sys, 'argv', ['afdko', *argv])
+        try:
+            with contextlib.redirect_stdout(buf_out), \
+                    contextlib.redirect_stderr(buf_err):
+                rc = _WORKER_INVOKER.main(list(argv))
+        except SystemExit as e:
+            rc = e.code
+    if rc is None:
+        rc = 0
+    return InvokerResult(rc, buf_out.getvalue(), buf_err.getvalue())
+
+
+def _get_pool():
+    global _POOL
+    if _POOL is None:
+        ctx = multiprocessing.get_context('fork')
+        _POOL = ctx.Pool(processes=1, initializer=_pool_init)
+    return _POOL
+
+
+def run_via_invoker_fast(cmd, *args):
+    """
+    Like call_invoker_inproc, but executed in a pre-warmed forked
+    worker: global state the tool mutates (logging config, sys.argv)
+    stays out of the pytest process. Requires fork, so on Windows
+    (and for native tools) this falls back to the regular paths.
+    """
+    if cmd not in PYTHON_COMMANDS:
+        return InvokerResult(run_via_invoker(cmd, *args), '', '')
+    if sys.platform == 'win32':
+        return call_invoker_inproc(cmd, *args)
+    return _get_pool().apply(_pool_main, ((cmd, *args),))
+
+
+def run_via_invoker(cmd, *args):
+    """
+    Run 'afdko <cmd> ...' and return the exit code. Pure-Python tools
+    are dispatched in-process; native tools get a subprocess.
+    """
+    if cmd in PYTHON_COMMANDS:
+        return call_invoker_inproc(cmd, *args).returncode
+    # only the exit code is returned, so don't pipe (or decode) the
+    # tool's output at all; the command is built as a tuple in one
+    # unpack instead of a list() conversion plus concatenation
+    return _call(('afdko', cmd, *args),
+                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def run_via_wrapper(cmd, *args):
+    """Run the legacy standalone console script and return the exit
+    code."""
+    return _call((cmd, *args),
+                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+# Shared thread pool for fanning out independent subprocesses from a
+# single test; the GIL is released while each thread waits on its
+# child, so wall time is bounded by the slowest process.
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count())
+
+
+def map_concurrent(func, items):
+    """Apply 'func' to every item on the shared executor and return
+    the results in order."""
+    return list(_EXECUTOR.map(func, items))
+
+
+def _hash_stdout(proc):
+    """Stream a process's stdout through sha256 and reap it."""
+    h = hashlib.sha256()
+    for chunk in iter(lambda: proc.stdout.read(65536), b''):
+        h.update(chunk)
+    proc.stdout.close()
+    proc.wait()
+    return proc.returncode, h.hexdigest()
+
+
+def run_pair_hashes(cmd_a, cmd_b):
+    """
+    Launch two commands concurrently and return (returncode, sha256)
+    for each stdout. The streams are hashed in 64KB chunks as they
+    arrive, so equality checks never hold either full output in
+    memory.
+    """
+    p_a = subprocess.Popen(cmd_a, stdout=subprocess.PIPE,
+                           stderr=subprocess.DEVNULL)
+    p_b = subprocess.Popen(cmd_b, stdout=subprocess.PIPE,
+                           stderr=subprocess.DEVNULL)
+    return _hash_stdout(p_a), _hash_stdout(p_b)